@@ -4,13 +4,48 @@
 # - Record income and expenses
 # - Calculate current balance
 # - View summary by expense categories
-# - Save and load data in JSON and CSV files
+# - Save and load data in JSON and CSV files (plus NDJSON and a compact binary format)
 # - Fully validated with good structure (OOP)
 # ===================================================================
 
 import json
 import csv
-from typing import List, Dict
+import io
+import mmap
+import multiprocessing
+import os
+import pickle
+import struct
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import IntEnum
+from itertools import compress
+from operator import itemgetter
+from typing import List, Dict, Tuple, Iterable, Optional, Sequence
+
+# Valid transaction types; the position in this tuple is the code stored in the tracker
+TYPES = ("income", "expense")
+
+
+class TransactionType(IntEnum):
+    """Integer code of each transaction type: its position in TYPES and the value in the type column."""
+    INCOME = 0
+    EXPENSE = 1
+
+
+# Size of the write buffer used when saving files (1 MiB): fewer, larger writes to disk
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Number of transactions encoded per write when saving NDJSON
+NDJSON_BATCH_SIZE = 1000
+
+# First bytes of the binary format, used to recognize the file when loading
+BINARY_MAGIC = b"EXPT"
+
+# Characters that force the csv module to quote a field
+CSV_SPECIAL_CHARACTERS = ',"\r\n'
 
 
 # ===================================================================
@@ -22,18 +57,32 @@ class Transaction:
     Examples: salary, rent, groceries, Netflix, etc.
     """
 
+    # Valid types and error texts (a translated subclass only needs to replace these)
+    TYPES = TYPES
+    TYPE_ERROR = "Type must be 'income' or 'expense'"
+    AMOUNT_ERROR = "Amount must be greater than 0"
+
+    # Fixed attributes: no per-instance __dict__, so each object is smaller and faster to read
+    __slots__ = ("type_code", "category", "amount")
+
     def __init__(self, transaction_type: str, category: str, amount: float):
         # Validation: only allows "income" or "expense"
-        if transaction_type not in ("income", "expense"):
-            raise ValueError("Type must be 'income' or 'expense'")
+        if transaction_type not in self.TYPES:
+            raise ValueError(self.TYPE_ERROR)
         # Validation: does not allow negative or zero amounts
         if amount <= 0:
-            raise ValueError("Amount must be greater than 0")
+            raise ValueError(self.AMOUNT_ERROR)
 
-        self.transaction_type = transaction_type  # "income" or "expense"
+        # Kept as a plain int (the TransactionType value), which is cheaper to build than the enum
+        self.type_code = self.TYPES.index(transaction_type)
         self.category = category  # E.g.: "salary", "food", "transportation"
         self.amount = amount     # Monetary value (e.g.: 2500.50)
 
+    @property
+    def transaction_type(self) -> str:
+        """The type as text: "income" or "expense"."""
+        return self.TYPES[self.type_code]
+
     # Converts the object to a dictionary (needed for saving to JSON/CSV)
     def to_dict(self) -> Dict:
         """Converts the transaction to a dictionary (for JSON or CSV)."""
@@ -53,70 +102,450 @@ class ExpenseTracker:
     It's like a small personal finance app.
     """
 
+    # Class of each transaction, field names in the files and texts shown to the user.
+    # A translated version of the tracker is a subclass that only replaces these.
+    transaction_class = Transaction
+    FIELDS = ("type", "category", "amount")
+    MESSAGES = {
+        "saved": "Data saved to {}",
+        "loaded": "Data loaded from {}",
+        "not_found": "{} file not found. Starting with empty list.",
+        "binary_not_found": "Binary file not found. Starting with empty list.",
+        "not_binary": "{} is not a transactions binary file",
+        "corrupt": "{} is corrupt or was saved on an incompatible system",
+        "invalid": "{} contains invalid transactions",
+    }
+
     def __init__(self):
-        self.transactions: List[Transaction] = []  # List that stores all transactions
+        # Transactions are stored by columns: position i of every array is transaction i
+        self._types = array("B")       # TransactionType code (index into TYPES)
+        self._categories = array("i")  # Category id (index into self._category_names)
+        self._amounts = array("d")     # Monetary value, always kept as a float (2500 is saved as 2500.0)
+        self._intern: Dict[str, int] = {}      # Category name -> category id
+        self._category_names: List[str] = []  # Category id -> category name
+        # Results of the last calculation; None means the data changed and it must be redone
+        self._balance_cache: Optional[float] = None
+        self._summary_cache: Optional[Dict[str, float]] = None
+
+    @property
+    def transactions(self) -> Tuple[Transaction, ...]:
+        """
+        Rebuilds the Transaction objects from the stored columns.
+        It is a read-only snapshot: use add_transaction() to add new ones.
+        """
+        names, labels, make = self._category_names, self.transaction_class.TYPES, self.transaction_class
+        return tuple(
+            make(labels[t], names[c], a)
+            for t, c, a in zip(self._types, self._categories, self._amounts)
+        )
+
+    # ==================== INTERNAL STORAGE ====================
+    def _category_id(self, category: str) -> int:
+        """Returns the id of a category, registering it the first time it appears."""
+        category_id = self._intern.get(category)
+        if category_id is None:
+            # sys.intern: the stored name is shared with equal string literals, so later
+            # lookups with them are resolved by identity without comparing characters.
+            # Other hashable categories (numbers, for example) are kept as they are
+            if isinstance(category, str):
+                category = sys.intern(category)
+            category_id = self._intern[category] = len(self._category_names)
+            self._category_names.append(category)
+        return category_id
+
+    def _append(self, transaction: Transaction) -> None:
+        """Stores an already validated transaction at the end of the columns."""
+        self._invalidate()
+        self._types.append(transaction.type_code)
+        self._categories.append(self._category_id(transaction.category))
+        self._amounts.append(transaction.amount)
+
+    def _invalidate(self) -> None:
+        """Discards the cached balance and summary (called on every change to the data)."""
+        self._balance_cache = None
+        self._summary_cache = None
+
+    def _reset(self) -> Tuple:
+        """Empties the columns and returns the previous ones (to restore them if a load fails)."""
+        self._invalidate()
+        previous = (self._types, self._categories, self._amounts, self._intern, self._category_names)
+        self._types = array("B")
+        self._categories = array("i")
+        self._amounts = array("d")
+        self._intern = {}
+        self._category_names = []
+        return previous
+
+    def _replace(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Discards the current data and stores the given transactions instead.
+        If any transaction fails, the previous data is kept.
+        """
+        previous = self._reset()
+        try:
+            for t in transactions:
+                self._append(t)
+        except Exception:
+            self._types, self._categories, self._amounts, self._intern, self._category_names = previous
+            raise
+
+    @classmethod
+    def _validate_columns(cls, types: Sequence[str], amounts: Iterable[float]) -> array:
+        """
+        Applies the Transaction validations to whole columns at once.
+        Returns the amounts as a typed array.
+        """
+        transaction_class = cls.transaction_class
+        try:
+            valid_types = set(types) <= set(transaction_class.TYPES)
+        except TypeError:  # An unhashable type (a list, a dict...) is not a valid one either
+            valid_types = False
+        if not valid_types:
+            raise ValueError(transaction_class.TYPE_ERROR)
+        amounts = array("d", amounts)
+        if amounts and min(amounts) <= 0:
+            raise ValueError(transaction_class.AMOUNT_ERROR)
+        return amounts
+
+    def _store_columns(self, types: Sequence[str], categories: Sequence[str], amounts: array) -> None:
+        """Appends already validated columns to the stored ones."""
+        new_categories = dict.fromkeys(categories)  # Fails on unhashable categories before changing anything
+        self._invalidate()
+        for category in new_categories:  # Registers each new category only once
+            self._category_id(category)
+        self._types.extend(map(self.transaction_class.TYPES.index, types))  # Position in TYPES = TransactionType code
+        self._categories.extend(map(self._intern.__getitem__, categories))
+        self._amounts.extend(amounts)
+
+    def _replace_columns(self, types: Sequence[str], categories: Sequence[str], amounts: Iterable[float]) -> None:
+        """Like _replace, but validates and stores whole columns instead of one object per row."""
+        amounts = self._validate_columns(types, amounts)
+        previous = self._reset()
+        try:
+            self._store_columns(types, categories, amounts)
+        except Exception:
+            self._types, self._categories, self._amounts, self._intern, self._category_names = previous
+            raise
+
+    @classmethod
+    def _csv_columns(cls, header: List[str], rows: List[List[str]]) -> Tuple[List[str], List[str], Iterable[float]]:
+        """Splits CSV rows into type, category and amount columns, found by header name (like DictReader)."""
+        type_col, category_col, amount_col = (itemgetter(header.index(name)) for name in cls.FIELDS)
+        # itemgetter/map extract each column in C, without a Python loop per row
+        return list(map(type_col, rows)), list(map(category_col, rows)), map(float, map(amount_col, rows))
+
+    def _as_records(self, start: int = 0, stop: Optional[int] = None) -> List[Dict]:
+        """Builds the JSON/CSV records straight from the columns (no Transaction objects)."""
+        names, labels = self._category_names, self.transaction_class.TYPES
+        type_key, category_key, amount_key = self.FIELDS
+        return [
+            {type_key: labels[t], category_key: names[c], amount_key: a}
+            for t, c, a in zip(self._types[start:stop], self._categories[start:stop], self._amounts[start:stop])
+        ]
+
+    def _expenses_per_category(self) -> List[float]:
+        """Single pass over the expense rows; returns the total spent per category id."""
+        per_category = [0.0] * len(self._category_names)
+        # TransactionType.EXPENSE is the only non-zero code, so compress() drops income rows in C
+        # and the loop only has to add each amount to its category's slot
+        for category_id, amount in compress(zip(self._categories, self._amounts), self._types):
+            per_category[category_id] += amount
+        return per_category
 
     # ==================== BASIC OPERATIONS ====================
     def add_transaction(self, transaction_type: str, category: str, amount: float) -> None:
         """Adds a new income or expense to the system."""
-        transaction = Transaction(transaction_type, category, amount)  # Creates transaction with validations
-        self.transactions.append(transaction)                         # Saves it to the list
+        transaction = self.transaction_class(transaction_type, category, amount)  # Creates it with validations
+        self._append(transaction)                                                # Saves it to the columns
+
+    def add_many(self, records: Iterable[Tuple[str, str, float]]) -> None:
+        """
+        Adds many transactions at once, given as (type, category, amount) tuples.
+        All of them are validated together; if any is invalid, none is added.
+        """
+        records = list(records)
+        types = list(map(itemgetter(0), records))
+        categories = list(map(itemgetter(1), records))
+        amounts = self._validate_columns(types, map(itemgetter(2), records))
+        self._store_columns(types, categories, amounts)
 
     def calculate_balance(self) -> float:
         """Calculates how much money you have left: total income - total expenses."""
-        income = sum(t.amount for t in self.transactions if t.transaction_type == "income")
-        expenses = sum(t.amount for t in self.transactions if t.transaction_type == "expense")
-        return income - expenses
+        if self._balance_cache is None:
+            # One scan over the columns; each total is accumulated in row order, so the
+            # result is exactly the one of adding the income and the expenses separately
+            income = expenses = 0.0
+            expense_code = TransactionType.EXPENSE
+            for code, amount in zip(self._types, self._amounts):
+                if code == expense_code:
+                    expenses += amount
+                else:
+                    income += amount
+            self._balance_cache = income - expenses
+        return self._balance_cache
 
     def summary_by_category(self) -> Dict[str, float]:
         """Shows how much you spent in each category (food, transportation, etc.)."""
-        summary: Dict[str, float] = {}
-        for t in self.transactions:
-            if t.transaction_type == "expense":
-                # If category exists, adds. If not, creates with 0 and adds
-                summary[t.category] = summary.get(t.category, 0) + t.amount
-        return summary
+        if self._summary_cache is None:
+            per_category = self._expenses_per_category()
+            # Categories in the order of their first expense (income rows also register
+            # categories, so the registration order is not the one to show)
+            first_seen = dict.fromkeys(compress(self._categories, self._types))
+            names = self._category_names
+            self._summary_cache = {names[c]: per_category[c] for c in first_seen}
+        return dict(self._summary_cache)  # A copy, so the caller cannot alter the cache
 
     # ==================== SAVING TO FILES ====================
-    def save_json(self, filename: str = "transactions.json") -> None:
-        """Saves all transactions to a JSON file (universal format)."""
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump([t.to_dict() for t in self.transactions], f, indent=4)
-        print(f"Data saved to {filename}")
+    def save_json(self, filename: str = "transactions.json", pretty: bool = False) -> None:
+        """
+        Saves all transactions to a JSON file (universal format).
+        Compact by default; pretty=True indents it for reading by a person.
+        """
+        if pretty:
+            data = json.dumps(self._as_records(), indent=4)
+        else:
+            # Without indentation the C encoder is used and the file is several times smaller
+            data = json.dumps(self._as_records(), separators=(",", ":"))
+        with open(filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)  # Everything is encoded in memory and written with a single call
+        print(self.MESSAGES["saved"].format(filename))
 
     def load_json(self, filename: str = "transactions.json") -> None:
         """Loads transactions from a JSON file."""
         try:
             with open(filename, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                self.transactions = [Transaction(**item) for item in data]
-            print(f"Data loaded from {filename}")
+            # Records with unknown keys are rejected, as Transaction(**record) used to do
+            if not all(map(set(self.FIELDS).issuperset, data)):
+                raise ValueError(self.MESSAGES["invalid"].format(filename))
+            # Fields are extracted as whole columns and validated once, not one Transaction per record
+            type_col, category_col, amount_col = map(itemgetter, self.FIELDS)
+            self._replace_columns(
+                list(map(type_col, data)),
+                list(map(category_col, data)),
+                map(amount_col, data),
+            )
+            print(self.MESSAGES["loaded"].format(filename))
+        except FileNotFoundError:
+            print(self.MESSAGES["not_found"].format("JSON"))
+            self._replace([])
+
+    def save_ndjson(self, filename: str = "transactions.ndjson") -> None:
+        """Saves transactions as NDJSON (one JSON object per line), in batches to save memory."""
+        with open(filename, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            for start in range(0, len(self._amounts), NDJSON_BATCH_SIZE):
+                batch = self._as_records(start, start + NDJSON_BATCH_SIZE)
+                f.write("".join(json.dumps(record, separators=(",", ":")) + "\n" for record in batch))
+        print(self.MESSAGES["saved"].format(filename))
+
+    def load_ndjson(self, filename: str = "transactions.ndjson") -> None:
+        """Loads transactions from an NDJSON file, reading it line by line."""
+        try:
+            with open(filename, "r", encoding="utf-8") as f:
+                records = (json.loads(line) for line in f if line.strip())
+                fields = itemgetter(*self.FIELDS)
+                self._replace(self.transaction_class(*fields(item)) for item in records)
+            print(self.MESSAGES["loaded"].format(filename))
         except FileNotFoundError:
-            print("JSON file not found. Starting with empty list.")
-            self.transactions = []
+            print(self.MESSAGES["not_found"].format("NDJSON"))
+            self._replace([])
 
     def save_csv(self, filename: str = "transactions.csv") -> None:
         """Saves transactions in CSV format (opens in Excel)."""
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["type", "category", "amount"])
-            writer.writeheader()
-            for t in self.transactions:
-                writer.writerow(t.to_dict())
-        print(f"Data saved to {filename}")
+        names, labels = self._category_names, self.transaction_class.TYPES
+        with open(filename, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            # Checked on str(name), the text written for any category (numbers included)
+            if any(char in name for name in map(str, names) for char in CSV_SPECIAL_CHARACTERS):
+                writer = csv.writer(f)
+                writer.writerow(self.FIELDS)
+                # Rows are built as tuples straight from the columns (no dict per row)
+                writer.writerows(zip(
+                    map(labels.__getitem__, self._types),
+                    map(names.__getitem__, self._categories),
+                    self._amounts,
+                ))
+            else:
+                # No field needs quoting, so the csv module's per-field checks are skipped:
+                # the "type,category," start of each row is prepared once per combination
+                prefixes = [[f"{label},{name}," for name in names] for label in labels]
+                f.write(",".join(self.FIELDS) + "\r\n")
+                f.writelines(
+                    f"{prefixes[t][c]}{a!r}\r\n"
+                    for t, c, a in zip(self._types, self._categories, self._amounts)
+                )
+        print(self.MESSAGES["saved"].format(filename))
 
     def load_csv(self, filename: str = "transactions.csv") -> None:
         """Loads transactions from a CSV file."""
         try:
-            with open(filename, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                self.transactions = [
-                    Transaction(row["type"], row["category"], float(row["amount"])) 
-                    for row in reader
+            with open(filename, "r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                header = next(reader, list(self.FIELDS))
+                rows = [row for row in reader if row]  # Skips blank lines, like DictReader
+            self._replace_columns(*self._csv_columns(header, rows))
+            print(self.MESSAGES["loaded"].format(filename))
+        except FileNotFoundError:
+            print(self.MESSAGES["not_found"].format("CSV"))
+            self._replace([])
+
+    def load_csv_parallel(self, filename: str = "transactions.csv", workers: Optional[int] = None) -> None:
+        """
+        Loads a large CSV file using several processes, each one parsing a slice of the file.
+        Files with quoted fields (which may span several lines) are loaded with load_csv instead.
+        """
+        try:
+            f = open(filename, "rb")
+        except FileNotFoundError:
+            print(self.MESSAGES["not_found"].format("CSV"))
+            self._replace([])
+            return
+
+        with f:
+            segments = []
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    header_end = data.find(b"\n") + 1
+                    if header_end and data.find(b'"') == -1:
+                        header = next(csv.reader([data[:header_end].decode("utf-8")]))
+                        segments = _split_on_newlines(data, header_end, workers or os.cpu_count() or 1)
+        if len(segments) < 2:
+            self.load_csv(filename)  # Nothing to split (or unsafe to split): load it normally
+            return
+
+        # Every slice is parsed and validated in its own process. The workers must find
+        # type(self) and _load_csv_segment by module name: forked workers inherit them, but
+        # "spawn"/"forkserver" workers re-import, which fails for modules loaded from a file
+        # path (like the Spanish version's base module), and a class from a module missing
+        # in sys.modules cannot be sent at all. In those cases the file is loaded serially.
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        try:
+            with ProcessPoolExecutor(max_workers=len(segments), mp_context=context) as pool:
+                futures = [
+                    pool.submit(_load_csv_segment, type(self), filename, start, stop, header)
+                    for start, stop in segments
                 ]
-            print(f"Data loaded from {filename}")
+                parts = [future.result() for future in futures]
+        except (BrokenProcessPool, ImportError, pickle.PicklingError):
+            self.load_csv(filename)
+            return
+
+        # All slices are valid: join them, translating each slice's category ids to ours
+        self._reset()
+        for part in parts:
+            new_ids = array("i", map(self._category_id, part._category_names))
+            self._types.extend(part._types)
+            self._categories.extend(map(new_ids.__getitem__, part._categories))
+            self._amounts.extend(part._amounts)
+        print(self.MESSAGES["loaded"].format(filename))
+
+    # ==================== BINARY FORMAT ====================
+    # Layout: BINARY_MAGIC | header size (uint32) | JSON header | types | category ids | amounts
+    # The columns are written as raw bytes, so saving and loading need no text conversion.
+    def save_binary(self, filename: str = "transactions.bin") -> None:
+        """Saves transactions in a compact binary format (much smaller and faster than JSON/CSV)."""
+        header = json.dumps({
+            "count": len(self._amounts),
+            "byteorder": sys.byteorder,
+            "categories": self._category_names,
+        }).encode("utf-8")
+        with open(filename, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(BINARY_MAGIC)
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            # Arrays expose their memory directly, so they are written without copies
+            f.write(self._types)
+            f.write(self._categories)
+            f.write(self._amounts)
+        print(self.MESSAGES["saved"].format(filename))
+
+    def load_binary(self, filename: str = "transactions.bin") -> None:
+        """Loads transactions from a file created with save_binary."""
+        try:
+            f = open(filename, "rb")
         except FileNotFoundError:
-            print("CSV file not found. Starting with empty list.")
-            self.transactions = []
+            print(self.MESSAGES["binary_not_found"])
+            self._replace([])
+            return
+
+        # The file is memory-mapped: the columns are copied straight from the OS page cache
+        # into the arrays, without first reading the whole file into a bytes object
+        with f:
+            # mmap cannot map an empty file (and an empty file is not one of ours anyway)
+            if not os.fstat(f.fileno()).st_size:
+                raise ValueError(self.MESSAGES["not_binary"].format(filename))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if len(data) < 8 or data[:4] != BINARY_MAGIC:
+                    raise ValueError(self.MESSAGES["not_binary"].format(filename))
+                (header_size,) = struct.unpack_from("<I", data, 4)
+                if 8 + header_size > len(data):
+                    raise ValueError(self.MESSAGES["corrupt"].format(filename))
+                header = json.loads(data[8:8 + header_size])
+                count, names = header["count"], header["categories"]
+
+                offset = 8 + header_size
+                types, categories, amounts = array("B"), array("i"), array("d")
+                columns = (types, categories, amounts)
+                if len(data) - offset != count * sum(column.itemsize for column in columns):
+                    raise ValueError(self.MESSAGES["corrupt"].format(filename))
+                for column in columns:
+                    size = count * column.itemsize
+                    with memoryview(data)[offset:offset + size] as chunk:
+                        column.frombytes(chunk)
+                    offset += size
+
+        if header["byteorder"] != sys.byteorder:
+            categories.byteswap()
+            amounts.byteswap()
+
+        # Same rules as Transaction, checked on whole columns
+        if count and (max(types) > TransactionType.EXPENSE or min(amounts) <= 0
+                      or min(categories) < 0 or max(categories) >= len(names)):
+            raise ValueError(self.MESSAGES["invalid"].format(filename))
+
+        # The category table is built before touching the current data, so a bad one keeps it
+        names = [sys.intern(name) if isinstance(name, str) else name for name in names]
+        try:
+            intern = {name: category_id for category_id, name in enumerate(names)}
+        except TypeError:  # A category that JSON cannot give back as a hashable value
+            raise ValueError(self.MESSAGES["invalid"].format(filename)) from None
+
+        self._reset()
+        self._types, self._categories, self._amounts = types, categories, amounts
+        self._category_names, self._intern = names, intern
+        print(self.MESSAGES["loaded"].format(filename))
+
+
+# ===================================================================
+# HELPERS FOR PARALLEL CSV LOADING
+# ===================================================================
+def _split_on_newlines(data: mmap.mmap, start: int, parts: int) -> List[Tuple[int, int]]:
+    """Splits data[start:] into up to `parts` byte ranges that each begin at the start of a line."""
+    size = len(data)
+    bounds = [start]
+    for i in range(1, parts):
+        target = max(start + (size - start) * i // parts, bounds[-1])
+        cut = data.find(b"\n", target) + 1  # Right after the next newline (0 if there is none)
+        if not cut:
+            break
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    bounds.append(size)
+    return [(begin, end) for begin, end in zip(bounds, bounds[1:]) if end > begin]
+
+
+def _load_csv_segment(tracker_class: type, filename: str, start: int, stop: int,
+                      header: List[str]) -> ExpenseTracker:
+    """Parses and validates one slice of a CSV file (runs in a worker process)."""
+    with open(filename, "rb") as f:
+        f.seek(start)
+        text = f.read(stop - start).decode("utf-8")
+    # Not str.splitlines(): it also breaks on characters such as \x0c or \u2028, which csv
+    # keeps inside the field (and save_csv writes unquoted), so the slice goes to csv as is
+    rows = [row for row in csv.reader(io.StringIO(text, newline="")) if row]
+    segment = tracker_class()
+    segment._replace_columns(*tracker_class._csv_columns(header, rows))
+    return segment
 
 
 # ===================================================================
@@ -1,144 +1,207 @@
-# ===================================================================
-# DESCRIPCIÓN GENERAL DEL PROGRAMA
-# Este es un sistema completo para llevar el control de tus finanzas personales:
-# - Registrar ingresos y gastos
-# - Calcular saldo actual
-# - Ver resumen por categorías de gasto
-# - Guardar y cargar datos en archivos JSON y CSV
-# - Totalmente validado y con buena estructura (POO)
-# ===================================================================
-
-import json
-import csv
-from typing import List, Dict
-
-
-# ===================================================================
-# CLASE 1: Movimiento - Representa un ingreso o gasto individual
-# ===================================================================
-class Movimiento:
-    """
-    Representa un movimiento financiero (ingreso o gasto).
-    Ejemplos: salario, alquiler, supermercado, Netflix, etc.
-    """
-
-    def __init__(self, tipo: str, categoria: str, monto: float):
-        # Validación: solo permite "ingreso" o "gasto"
-        if tipo not in ("ingreso", "gasto"):
-            raise ValueError("El tipo debe ser 'ingreso' o 'gasto'")
-        # Validación: no permite montos negativos o cero
-        if monto <= 0:
-            raise ValueError("El monto debe ser mayor a 0")
-
-        self.tipo = tipo          # "ingreso" o "gasto"
-        self.categoria = categoria  # Ej: "salario", "alimentación", "transporte"
-        self.monto = monto        # Valor en dinero (ej: 2500.50)
-
-    # Convierte el objeto en diccionario (necesario para guardar en JSON/CSV)
-    def to_dict(self) -> Dict:
-        """Convierte el movimiento en diccionario (para JSON o CSV)."""
-        return {"tipo": self.tipo, "categoria": self.categoria, "monto": self.monto}
-
-
-# ===================================================================
-# CLASE 2: ControlGastos - El cerebro del sistema
-# ===================================================================
-class ControlGastos:
-    """
-    Sistema principal para registrar y analizar movimientos financieros.
-    Es como una pequeña app de finanzas personales.
-    """
-
-    def __init__(self):
-        self.movimientos: List[Movimiento] = []  # Lista que guarda todos los movimientos
-
-    # ==================== OPERACIONES BÁSICAS ====================
-    def agregar_movimiento(self, tipo: str, categoria: str, monto: float) -> None:
-        """Agrega un nuevo ingreso o gasto al sistema."""
-        movimiento = Movimiento(tipo, categoria, monto)  # Crea el movimiento con validaciones
-        self.movimientos.append(movimiento)             # Lo guarda en la lista
-
-    def calcular_saldo(self) -> float:
-        """Calcula cuánto dinero te queda: ingresos totales - gastos totales."""
-        ingresos = sum(m.monto for m in self.movimientos if m.tipo == "ingreso")
-        gastos = sum(m.monto for m in self.movimientos if m.tipo == "gasto")
-        return ingresos - gastos
-
-    def resumen_por_categoria(self) -> Dict[str, float]:
-        """Muestra cuánto gastaste en cada categoría (alimentación, transporte, etc.)."""
-        resumen: Dict[str, float] = {}
-        for m in self.movimientos:
-            if m.tipo == "gasto":
-                # Si la categoría ya existe, suma. Si no, crea con 0 y suma
-                resumen[m.categoria] = resumen.get(m.categoria, 0) + m.monto
-        return resumen
-
-    # ==================== GUARDAR EN ARCHIVOS ====================
-    def guardar_json(self, archivo: str = "movimientos.json") -> None:
-        """Guarda todos los movimientos en un archivo JSON (formato universal)."""
-        with open(archivo, "w", encoding="utf-8") as f:
-            json.dump([m.to_dict() for m in self.movimientos], f, indent=4)
-        print(f"Datos guardados en {archivo}")
-
-    def cargar_json(self, archivo: str = "movimientos.json") -> None:
-        """Carga movimientos desde un archivo JSON."""
-        try:
-            with open(archivo, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.movimientos = [Movimiento(**item) for item in data]
-            print(f"Datos cargados desde {archivo}")
-        except FileNotFoundError:
-            print("No se encontró el archivo JSON. Iniciando con lista vacía.")
-            self.movimientos = []
-
-    def guardar_csv(self, archivo: str = "movimientos.csv") -> None:
-        """Guarda los movimientos en formato CSV (se abre en Excel)."""
-        with open(archivo, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["tipo", "categoria", "monto"])
-            writer.writeheader()
-            for m in self.movimientos:
-                writer.writerow(m.to_dict())
-        print(f"Datos guardados en {archivo}")
-
-    def cargar_csv(self, archivo: str = "movimientos.csv") -> None:
-        """Carga movimientos desde un archivo CSV."""
-        try:
-            with open(archivo, "r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                self.movimientos = [Movimiento(row["tipo"], row["categoria"], float(row["monto"])) for row in reader]
-            print(f"Datos cargados desde {archivo}")
-        except FileNotFoundError:
-            print("No se encontró el archivo CSV. Iniciando con lista vacía.")
-            self.movimientos = []
-
-
-# ===================================================================
-# EJEMPLO DE USO REAL (prueba del sistema)
-# ===================================================================
-if __name__ == "__main__":
-    # Creamos un nuevo sistema de control de gastos
-    sistema = ControlGastos()
-
-    # Registramos algunos movimientos de ejemplo
-    sistema.agregar_movimiento("ingreso", "salario", 2500)
-    sistema.agregar_movimiento("gasto", "alimentación", 300)
-    sistema.agregar_movimiento("gasto", "transporte", 150)
-    sistema.agregar_movimiento("gasto", "ocio", 200)
-
-    # Mostramos el saldo actual
-    print(f"Saldo actual: ${sistema.calcular_saldo():,.2f}")
-
-    # Mostramos cuánto se gastó en cada categoría
-    print("\nResumen de gastos por categoría:")
-    for categoria, total in sistema.resumen_por_categoria().items():
-        print(f" - {categoria}: ${total:,.2f}")
-
-    # Guardamos los datos en archivos
-    sistema.guardar_json("movimientos.json")
-    sistema.guardar_csv("movimientos.csv")
-
-    # Probamos cargar desde JSON
-    print("\n--- Probando cargar desde archivo ---")
-    nuevo_sistema = ControlGastos()
-    nuevo_sistema.cargar_json("movimientos.json")
+# ===================================================================
+# DESCRIPCIÓN GENERAL DEL PROGRAMA
+# Este es un sistema completo para llevar el control de tus finanzas personales:
+# - Registrar ingresos y gastos
+# - Calcular saldo actual
+# - Ver resumen por categorías de gasto
+# - Guardar y cargar datos en archivos JSON y CSV (además de NDJSON y un formato binario compacto)
+# - Totalmente validado y con buena estructura (POO)
+#
+# Esta es la versión en español. Toda la lógica vive en la versión en inglés
+# (Personal-Expense-Control-System-with-JSON-CSV-Persistence-in-Python.py, que debe
+# estar en la misma carpeta); aquí solo se traducen los nombres, los textos y los campos.
+# ===================================================================
+
+import importlib.util
+import sys
+from enum import IntEnum
+from pathlib import Path
+from typing import Dict, Tuple, Iterable, Optional
+
+# Carga la versión en inglés desde el archivo vecino (su nombre no se puede importar con "import")
+_ruta_base = Path(__file__).with_name("Personal-Expense-Control-System-with-JSON-CSV-Persistence-in-Python.py")
+_spec = importlib.util.spec_from_file_location("control_gastos_base", _ruta_base)
+base = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = base
+_spec.loader.exec_module(base)
+
+# Tipos válidos de movimiento; la posición en esta tupla es el código que guarda el sistema
+TIPOS = ("ingreso", "gasto")
+
+
+class TipoMovimiento(IntEnum):
+    """Código entero de cada tipo de movimiento (más barato de comparar que el texto)."""
+    INGRESO = base.TransactionType.INCOME
+    GASTO = base.TransactionType.EXPENSE
+
+
+# ===================================================================
+# CLASE 1: Movimiento - Representa un ingreso o gasto individual
+# ===================================================================
+class Movimiento(base.Transaction):
+    """
+    Representa un movimiento financiero (ingreso o gasto).
+    Ejemplos: salario, alquiler, supermercado, Netflix, etc.
+    """
+
+    # Tipos válidos y textos de error en español
+    TYPES = TIPOS
+    TYPE_ERROR = "El tipo debe ser 'ingreso' o 'gasto'"
+    AMOUNT_ERROR = "El monto debe ser mayor a 0"
+
+    __slots__ = ()  # Usa los mismos atributos fijos que Transaction
+
+    def __init__(self, tipo: str, categoria: str, monto: float):
+        super().__init__(tipo, categoria, monto)  # Las validaciones son las de Transaction
+
+    # Nombres en español de los atributos
+    @property
+    def tipo(self) -> str:
+        """El tipo como texto: "ingreso" o "gasto"."""
+        return self.transaction_type
+
+    @property
+    def codigo_tipo(self) -> TipoMovimiento:
+        """El tipo como código entero: INGRESO o GASTO."""
+        return TipoMovimiento(self.type_code)
+
+    @property
+    def categoria(self) -> str:
+        """Ej: "salario", "alimentación", "transporte"."""
+        return self.category
+
+    @property
+    def monto(self) -> float:
+        """Valor en dinero (ej: 2500.50)."""
+        return self.amount
+
+    # Convierte el objeto en diccionario (necesario para guardar en JSON/CSV)
+    def to_dict(self) -> Dict:
+        """Convierte el movimiento en diccionario (para JSON o CSV)."""
+        return {"tipo": self.tipo, "categoria": self.categoria, "monto": self.monto}
+
+
+# ===================================================================
+# CLASE 2: ControlGastos - El cerebro del sistema
+# ===================================================================
+class ControlGastos(base.ExpenseTracker):
+    """
+    Sistema principal para registrar y analizar movimientos financieros.
+    Es como una pequeña app de finanzas personales.
+    """
+
+    # Clase de cada movimiento, nombres de los campos en los archivos y textos para el usuario
+    transaction_class = Movimiento
+    FIELDS = ("tipo", "categoria", "monto")
+    MESSAGES = {
+        "saved": "Datos guardados en {}",
+        "loaded": "Datos cargados desde {}",
+        "not_found": "No se encontró el archivo {}. Iniciando con lista vacía.",
+        "binary_not_found": "No se encontró el archivo binario. Iniciando con lista vacía.",
+        "not_binary": "{} no es un archivo binario de movimientos",
+        "corrupt": "{} está dañado o se guardó en un sistema incompatible",
+        "invalid": "{} contiene movimientos inválidos",
+    }
+
+    @property
+    def movimientos(self) -> Tuple[Movimiento, ...]:
+        """
+        Reconstruye los objetos Movimiento a partir de las columnas guardadas.
+        Es una copia de solo lectura: usa agregar_movimiento() para añadir nuevos.
+        """
+        return self.transactions
+
+    # ==================== OPERACIONES BÁSICAS ====================
+    def agregar_movimiento(self, tipo: str, categoria: str, monto: float) -> None:
+        """Agrega un nuevo ingreso o gasto al sistema."""
+        self.add_transaction(tipo, categoria, monto)
+
+    def agregar_varios(self, registros: Iterable[Tuple[str, str, float]]) -> None:
+        """
+        Agrega muchos movimientos de una vez, dados como tuplas (tipo, categoria, monto).
+        Se validan todos juntos; si alguno es inválido, no se agrega ninguno.
+        """
+        self.add_many(registros)
+
+    def calcular_saldo(self) -> float:
+        """Calcula cuánto dinero te queda: ingresos totales - gastos totales."""
+        return self.calculate_balance()
+
+    def resumen_por_categoria(self) -> Dict[str, float]:
+        """Muestra cuánto gastaste en cada categoría (alimentación, transporte, etc.)."""
+        return self.summary_by_category()
+
+    # ==================== GUARDAR EN ARCHIVOS ====================
+    def guardar_json(self, archivo: str = "movimientos.json", legible: bool = False) -> None:
+        """
+        Guarda todos los movimientos en un archivo JSON (formato universal).
+        Compacto por defecto; legible=True lo indenta para que lo lea una persona.
+        """
+        self.save_json(archivo, pretty=legible)
+
+    def cargar_json(self, archivo: str = "movimientos.json") -> None:
+        """Carga movimientos desde un archivo JSON."""
+        self.load_json(archivo)
+
+    def guardar_ndjson(self, archivo: str = "movimientos.ndjson") -> None:
+        """Guarda los movimientos como NDJSON (un objeto JSON por línea), por lotes para ahorrar memoria."""
+        self.save_ndjson(archivo)
+
+    def cargar_ndjson(self, archivo: str = "movimientos.ndjson") -> None:
+        """Carga movimientos desde un archivo NDJSON, leyéndolo línea por línea."""
+        self.load_ndjson(archivo)
+
+    def guardar_csv(self, archivo: str = "movimientos.csv") -> None:
+        """Guarda los movimientos en formato CSV (se abre en Excel)."""
+        self.save_csv(archivo)
+
+    def cargar_csv(self, archivo: str = "movimientos.csv") -> None:
+        """Carga movimientos desde un archivo CSV."""
+        self.load_csv(archivo)
+
+    def cargar_csv_paralelo(self, archivo: str = "movimientos.csv", procesos: Optional[int] = None) -> None:
+        """
+        Carga un archivo CSV grande usando varios procesos, cada uno analiza una parte del archivo.
+        Los archivos con campos entre comillas (que pueden ocupar varias líneas) se cargan con cargar_csv.
+        """
+        self.load_csv_parallel(archivo, workers=procesos)
+
+    def guardar_binario(self, archivo: str = "movimientos.bin") -> None:
+        """Guarda los movimientos en un formato binario compacto (mucho más chico y rápido que JSON/CSV)."""
+        self.save_binary(archivo)
+
+    def cargar_binario(self, archivo: str = "movimientos.bin") -> None:
+        """Carga movimientos desde un archivo creado con guardar_binario."""
+        self.load_binary(archivo)
+
+
+# ===================================================================
+# EJEMPLO DE USO REAL (prueba del sistema)
+# ===================================================================
+if __name__ == "__main__":
+    # Creamos un nuevo sistema de control de gastos
+    sistema = ControlGastos()
+
+    # Registramos algunos movimientos de ejemplo
+    sistema.agregar_movimiento("ingreso", "salario", 2500)
+    sistema.agregar_movimiento("gasto", "alimentación", 300)
+    sistema.agregar_movimiento("gasto", "transporte", 150)
+    sistema.agregar_movimiento("gasto", "ocio", 200)
+
+    # Mostramos el saldo actual
+    print(f"Saldo actual: ${sistema.calcular_saldo():,.2f}")
+
+    # Mostramos cuánto se gastó en cada categoría
+    print("\nResumen de gastos por categoría:")
+    for categoria, total in sistema.resumen_por_categoria().items():
+        print(f" - {categoria}: ${total:,.2f}")
+
+    # Guardamos los datos en archivos
+    sistema.guardar_json("movimientos.json")
+    sistema.guardar_csv("movimientos.csv")
+
+    # Probamos cargar desde JSON
+    print("\n--- Probando cargar desde archivo ---")
+    nuevo_sistema = ControlGastos()
+    nuevo_sistema.cargar_json("movimientos.json")
     print(f"Saldo después de cargar desde JSON: ${nuevo_sistema.calcular_saldo():,.2f}")
\ No newline at end of file